@@ -5,12 +5,18 @@ WAVE Validator Benchmark Script
 Tests validator performance, accuracy, and chaos resistance.
 """
 
+import asyncio
+import hashlib
+import itertools
 import json
+import re
 import subprocess
 import time
 import random
+import statistics
 import sys
 import os
+from collections import OrderedDict, deque
 from pathlib import Path
 
 # Sample documents for testing
@@ -105,135 +111,340 @@ More unrelated content here.
 The document ends here.
 """
 
+# Benchmark corpus as (name, content) pairs, defined once
+DOCUMENTS = (
+    ('Coherent', COHERENT_DOC),
+    ('Medium', MEDIUM_DOC),
+    ('Incoherent', INCOHERENT_DOC),
+)
 
-def create_temp_file(content):
-    """Create a temporary file with content"""
-    import tempfile
-    fd, path = tempfile.mkstemp(suffix='.md')
-    with os.fdopen(fd, 'w') as f:
-        f.write(content)
-    return path
+# Expected score band for each entry in DOCUMENTS
+EXPECTED_SCORES = ('>80%', '60-80%', '<60%')
 
 
-def run_validator(filepath, threshold=80):
-    """Run the WAVE validator on a file"""
-    cmd = ['node', 'build/index.js', 'wave-validate', filepath, '--threshold', str(threshold)]
+# Validated once by every worker before any timed run, to absorb JIT warm-up
+WARMUP_DOCUMENT = COHERENT_DOC
+
+# Modifications inject_chaos can apply to a line
+CHAOS_TYPES = ('delete', 'duplicate', 'scramble')
+
+# Score line printed by `wave-validate` in CLI mode
+_SCORE_RE = re.compile(rb'Overall Score:\s*(\d+)%')
+
+# Environment for cold-start validator processes: just enough to find node
+_VALIDATOR_ENV = {'PATH': os.environ.get('PATH', ''), 'NODE_ENV': 'production'}
+
+
+def run_validator(content, threshold=80):
+    """Run the WAVE validator on document content in a fresh node process"""
+    cmd = ['node', 'build/index.js', 'wave-validate', '--content', content, '--threshold', str(threshold)]
     
-    start = time.time()
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    elapsed = time.time() - start
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, check=False, env=_VALIDATOR_ENV)
+    elapsed = time.perf_counter() - start
     
-    # Parse output to get score
-    score = None
-    for line in result.stdout.split('\n'):
-        if 'Overall Score:' in line:
-            score = int(line.split(':')[1].split('%')[0].strip())
-            break
+    # Pull the score straight out of the raw stdout bytes
+    match = _SCORE_RE.search(result.stdout)
+    score = int(match.group(1)) if match else None
     
     return {
         'score': score,
         'elapsed': elapsed,
         'passed': result.returncode == 0,
+        # Raw bytes; decode only when inspecting a failed run
         'stdout': result.stdout,
-        'stderr': result.stderr
+        'stderr': result.stderr,
     }
 
 
-def inject_chaos(content, level=0.1):
-    """Inject random chaos into document content"""
-    lines = content.split('\n')
-    num_modifications = max(1, int(len(lines) * level))
-    
-    for _ in range(num_modifications):
-        idx = random.randint(0, len(lines) - 1)
+class ValidatorClient:
+    """Persistent WAVE validator worker (`wave-validate --server`).
+
+    Node startup costs far more than a single validation, so the benchmark
+    keeps one process alive and exchanges one JSON line per request instead
+    of spawning `node` for every sample. Requests are pipelined: callers may
+    have several in flight, and since the server answers strictly in order,
+    replies resolve the pending requests first-in first-out. With
+    cold_start=True every call runs run_validator in a thread instead, which
+    measures CLI startup too.
+    """
+
+    def __init__(self, cold_start=False):
+        self.cold_start = cold_start
+        self.proc = None
+        self.reader = None
+        self.pending = deque()
+
+    async def __aenter__(self):
+        if not self.cold_start:
+            self.proc = await asyncio.create_subprocess_exec(
+                'node', 'build/index.js', 'wave-validate', '--server',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=1 << 24,  # batch replies are a single (long) line
+            )
+            self.reader = asyncio.create_task(self._read_replies())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the worker's stdin and wait for it to exit"""
+        if self.proc is not None:
+            self.proc.stdin.close()
+            await self.proc.wait()
+            await self.reader
+            self.proc = None
+
+    async def _read_replies(self):
+        """Resolve pending requests with reply lines as they arrive
+
+        Whatever ends the loop (EOF, a non-JSON line, a reply nobody asked
+        for), every request still pending fails instead of hanging forever.
+        """
+        error = RuntimeError("Validator server exited unexpectedly")
+        try:
+            while True:
+                line = await self.proc.stdout.readline()
+                if not line:
+                    break
+                reply = json.loads(line)
+                if not self.pending:
+                    raise RuntimeError(f"Unexpected validator reply: {line[:200]!r}")
+                self.pending.popleft().set_result(reply)
+        except (ValueError, RuntimeError) as e:
+            error = RuntimeError(f"Validator server protocol error: {e}")
+            # The reply stream is out of step; nothing more it says can be trusted
+            self.proc.kill()
+        finally:
+            while self.pending:
+                self.pending.popleft().set_exception(error)
+
+    async def _request(self, payload):
+        """Send one JSON request line and wait for its JSON reply line"""
+        if self.reader.done():
+            raise RuntimeError("Validator server is no longer running")
+        reply = asyncio.get_running_loop().create_future()
+        self.pending.append(reply)
+        self.proc.stdin.write((json.dumps(payload) + '\n').encode())
+        await self.proc.stdin.drain()
+        return await reply
+
+    @staticmethod
+    def _result(reply):
+        """Convert a server reply into run_validator's result shape"""
+        if 'error' in reply:
+            raise RuntimeError(f"Validator error: {reply['error']}")
+        return {
+            'score': reply['score'],
+            'elapsed': reply['elapsed_ms'] / 1000,
+            'passed': reply['passed'],
+        }
+
+    async def validate_batch(self, jobs):
+        """Validate a list of (content, threshold) jobs in one round-trip"""
+        if self.cold_start:
+            return [await asyncio.to_thread(run_validator, content, threshold)
+                    for content, threshold in jobs]
+        
+        reply = await self._request({'batch': [
+            {'content': content, 'threshold': threshold} for content, threshold in jobs
+        ]})
+        # A request-level failure comes back as a single {"error": ...} reply
+        return [self._result(item) for item in reply.get('results', [reply])]
+
+
+class ValidatorPool:
+    """A fixed set of ValidatorClient workers shared by concurrent tasks.
+
+    Validations are independent and CPU-bound inside node, so batches are
+    split across `size` worker processes and awaited together; the event
+    loop only shuttles JSON over pipes.
+
+    Callers that check verdicts rather than time the validator can pass
+    cached=True to reuse results for identical (content, threshold) jobs
+    from an LRU cache of `cache_size` entries (0 disables it).
+    """
+
+    def __init__(self, size=None, cold_start=False, cache_size=1024):
+        self.size = max(1, size or os.cpu_count() or 1)
+        self.cold_start = cold_start
+        self.clients = [ValidatorClient(cold_start=cold_start) for _ in range(self.size)]
+        self.next_client = itertools.cycle(self.clients)
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+
+    async def __aenter__(self):
+        await asyncio.gather(*(client.__aenter__() for client in self.clients))
+        if not self.cold_start:
+            # Every worker's first validation pays JIT warm-up; spend it here,
+            # outside any timed batch, rather than on whichever samples land first
+            await asyncio.gather(*(
+                client.validate_batch([(WARMUP_DOCUMENT, 80)]) for client in self.clients
+            ))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.gather(*(client.close() for client in self.clients))
+
+    async def validate_batch(self, jobs, cached=False, serial=False):
+        """Validate (content, threshold) jobs; results keep job order
+
+        serial=True runs the jobs one at a time on a single worker, for
+        timings that must not compete with each other for CPU.
+        """
+        if not (cached and self.cache_size):
+            return await self._dispatch(jobs, serial)
         
-        chaos_type = random.choice(['delete', 'duplicate', 'scramble'])
+        keys = [
+            (hashlib.blake2b(content.encode(), digest_size=16).digest(), threshold)
+            for content, threshold in jobs
+        ]
         
-        if chaos_type == 'delete':
-            lines[idx] = ''
-        elif chaos_type == 'duplicate':
-            lines.insert(idx, lines[idx])
-        elif chaos_type == 'scramble':
-            words = lines[idx].split()
-            random.shuffle(words)
-            lines[idx] = ' '.join(words)
+        # Collect hits first, then validate each distinct miss exactly once
+        found = {}
+        misses = {}
+        for key, job in zip(keys, jobs):
+            if key in found or key in misses:
+                continue
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                found[key] = self.cache[key]
+            else:
+                misses[key] = job
+        
+        if misses:
+            for key, result in zip(misses, await self._dispatch(list(misses.values()), serial)):
+                found[key] = result
+                self.cache[key] = result
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        
+        return [found[key] for key in keys]
+
+    async def _dispatch(self, jobs, serial=False):
+        """Split jobs across workers (or run them on one, if serial); results keep job order"""
+        if not jobs:
+            return []
+        if serial:
+            return await next(self.next_client).validate_batch(jobs)
+        
+        chunk_size = -(-len(jobs) // self.size)  # ceil division
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        results = await asyncio.gather(*(
+            next(self.next_client).validate_batch(chunk) for chunk in chunks
+        ))
+        return [result for chunk_results in results for result in chunk_results]
+
+
+def inject_chaos(lines, level=0.1):
+    """Inject random chaos into a document given as a list of lines
+
+    Modifications are drawn up front against the original line indices and
+    applied in a single forward pass, so `lines` itself is left untouched.
+    """
+    num_modifications = max(1, int(len(lines) * level))
+    shuffle = random.shuffle
+    
+    # Line index -> modification types to apply to it, in draw order
+    actions = {}
+    for idx, chaos_type in zip(
+        random.choices(range(len(lines)), k=num_modifications),
+        random.choices(CHAOS_TYPES, k=num_modifications),
+    ):
+        actions.setdefault(idx, []).append(chaos_type)
+    
+    out = []
+    append = out.append
+    for idx, line in enumerate(lines):
+        for chaos_type in actions.get(idx, ()):
+            if chaos_type == 'delete':
+                line = ''
+            elif chaos_type == 'duplicate':
+                append(line)
+            elif chaos_type == 'scramble':
+                words = line.split()
+                shuffle(words)
+                line = ' '.join(words)
+        append(line)
     
-    return '\n'.join(lines)
+    return '\n'.join(out)
 
 
-def benchmark_performance(iterations=10):
+async def benchmark_performance(client, iterations=10):
     """Benchmark validator performance"""
     print(f"\n{'='*60}")
     print("PERFORMANCE BENCHMARK")
     print(f"{'='*60}\n")
     
-    docs = {
-        'Coherent': COHERENT_DOC,
-        'Medium': MEDIUM_DOC,
-        'Incoherent': INCOHERENT_DOC
-    }
+    # Never cached: this test is timing the validator itself.
+    if client.cold_start:
+        # Each sample's time is the wall time of a whole node process, so
+        # samples run one after another to keep CPU contention out of it
+        all_results = [
+            await client.validate_batch([(content, 80)] * iterations, serial=True)
+            for _, content in DOCUMENTS
+        ]
+    else:
+        # All documents are in flight at once; timings are measured per item
+        # inside the validator, so overlapping them does not skew the numbers
+        all_results = await asyncio.gather(*(
+            client.validate_batch([(content, 80)] * iterations) for _, content in DOCUMENTS
+        ))
     
-    for name, content in docs.items():
+    for (name, content), results in zip(DOCUMENTS, all_results):
         print(f"Testing {name} document ({len(content)} chars)...")
         
-        times = []
-        scores = []
-        
-        for i in range(iterations):
-            filepath = create_temp_file(content)
-            try:
-                result = run_validator(filepath, threshold=80)
-                times.append(result['elapsed'])
-                if result['score'] is not None:
-                    scores.append(result['score'])
-            finally:
-                os.unlink(filepath)
+        # Column views of the per-sample results for aggregation
+        times = [result['elapsed'] for result in results]
+        scores = [result['score'] for result in results if result['score'] is not None]
         
-        avg_time = sum(times) / len(times)
-        avg_score = sum(scores) / len(scores) if scores else 0
+        # Median/percentiles rather than the mean alone: one slow outlier
+        # should not read as a regression
+        if len(times) > 1:
+            cuts = statistics.quantiles(times, n=100, method='inclusive')
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+        else:
+            p50 = p95 = p99 = times[0]
+        avg_time = statistics.fmean(times)
+        avg_score = statistics.fmean(scores) if scores else 0
+        std_score = statistics.pstdev(scores) if scores else 0
         
-        print(f"  Avg Time: {avg_time:.3f}s")
-        print(f"  Avg Score: {avg_score:.0f}%")
-        print(f"  Min/Max Time: {min(times):.3f}s / {max(times):.3f}s")
+        print(f"  Median Time: {p50 * 1000:.2f}ms (p95 {p95 * 1000:.2f}ms, p99 {p99 * 1000:.2f}ms)")
+        print(f"  Avg Time: {avg_time * 1000:.2f}ms")
+        print(f"  Avg Score: {avg_score:.0f}% (±{std_score:.1f})")
+        print(f"  Min/Max Time: {min(times) * 1000:.2f}ms / {max(times) * 1000:.2f}ms")
         print()
 
 
-def test_threshold_accuracy():
+async def test_threshold_accuracy(client):
     """Test validator accuracy at different thresholds"""
     print(f"\n{'='*60}")
     print("THRESHOLD ACCURACY TEST")
     print(f"{'='*60}\n")
     
-    docs = {
-        'Coherent (expected >80%)': COHERENT_DOC,
-        'Medium (expected 60-80%)': MEDIUM_DOC,
-        'Incoherent (expected <60%)': INCOHERENT_DOC
-    }
-    
     thresholds = [60, 80, 99]
     
-    for name, content in docs.items():
-        print(f"{name}:")
-        filepath = create_temp_file(content)
-        try:
-            result = run_validator(filepath, threshold=80)
-            score = result['score']
-            print(f"  Score: {score}%")
-            
-            for threshold in thresholds:
-                filepath2 = create_temp_file(content)
-                try:
-                    result2 = run_validator(filepath2, threshold=threshold)
-                    status = "✅ PASS" if result2['passed'] else "❌ FAIL"
-                    print(f"    Threshold {threshold}%: {status}")
-                finally:
-                    os.unlink(filepath2)
-        finally:
-            os.unlink(filepath)
+    # The score does not depend on the threshold, only the verdict does
+    # (validator passes when score >= threshold), so validate each doc once.
+    results = await client.validate_batch(
+        [(content, 80) for _, content in DOCUMENTS], cached=True)
+    
+    for (name, content), expected, result in zip(DOCUMENTS, EXPECTED_SCORES, results):
+        print(f"{name} (expected {expected}):")
+        score = result['score']
+        print(f"  Score: {score}%")
+        
+        for threshold in thresholds:
+            passed = score is not None and score >= threshold
+            status = "✅ PASS" if passed else "❌ FAIL"
+            print(f"    Threshold {threshold}%: {status}")
         print()
 
 
-def test_chaos_resistance(iterations=10):
+async def test_chaos_resistance(client, iterations=10):
     """Test validator's ability to detect chaos injection"""
     print(f"\n{'='*60}")
     print("CHAOS INJECTION TEST")
@@ -244,19 +455,23 @@ def test_chaos_resistance(iterations=10):
     chaos_levels = [0.0, 0.1, 0.2, 0.3, 0.5]
     baseline_score = None
     
-    for level in chaos_levels:
+    # Build every level's samples up front from a single split of the document
+    base_lines = COHERENT_DOC.split('\n')
+    corpus = {
+        level: [inject_chaos(base_lines, level) for _ in range(iterations)]
+        for level in chaos_levels if level > 0.0
+    }
+    corpus[0.0] = [COHERENT_DOC] * iterations
+    
+    # Validate every level concurrently, then report them in order
+    all_results = await asyncio.gather(*(
+        client.validate_batch([(content, 80) for content in corpus[level]], cached=True)
+        for level in chaos_levels
+    ))
+    
+    for level, results in zip(chaos_levels, all_results):
         print(f"Chaos Level: {int(level*100)}%")
-        scores = []
-        
-        for i in range(iterations):
-            content = COHERENT_DOC if level == 0.0 else inject_chaos(COHERENT_DOC, level)
-            filepath = create_temp_file(content)
-            try:
-                result = run_validator(filepath, threshold=80)
-                if result['score'] is not None:
-                    scores.append(result['score'])
-            finally:
-                os.unlink(filepath)
+        scores = [result['score'] for result in results if result['score'] is not None]
         
         avg_score = sum(scores) / len(scores) if scores else 0
         
@@ -269,6 +484,17 @@ def test_chaos_resistance(iterations=10):
         print()
 
 
+async def run_benchmarks(args, workers, cache_size):
+    """Run the selected benchmarks against a shared pool of validator workers"""
+    pool = ValidatorPool(size=workers, cold_start=args.cold_start, cache_size=cache_size)
+    async with pool as client:
+        await benchmark_performance(client, args.iterations)
+        await test_threshold_accuracy(client)
+        
+        if args.chaos_mode:
+            await test_chaos_resistance(client, args.iterations)
+
+
 def main():
     """Main benchmark function"""
     import argparse
@@ -276,8 +502,16 @@ def main():
     parser = argparse.ArgumentParser(description='Benchmark WAVE validator')
     parser.add_argument('--iterations', type=int, default=10, help='Number of iterations')
     parser.add_argument('--chaos-mode', action='store_true', help='Run chaos injection tests')
+    parser.add_argument('--cold-start', action='store_true',
+                        help='Spawn a fresh node process per validation (includes startup cost)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of parallel validator workers (default: min(iterations, CPU count))')
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=True,
+                        help='Reuse results for repeated documents in accuracy/chaos tests (default: on)')
     
     args = parser.parse_args()
+    if args.iterations < 1:
+        parser.error('--iterations must be at least 1')
     
     # Check if validator exists
     if not os.path.exists('build/index.js'):
@@ -287,12 +521,12 @@ def main():
     print("\n🌊 WAVE Validator Benchmark Suite")
     print(f"Iterations: {args.iterations}")
     
-    # Run benchmarks
-    benchmark_performance(args.iterations)
-    test_threshold_accuracy()
+    workers = args.workers or min(args.iterations, os.cpu_count() or 1)
+    print(f"Workers: {workers}")
     
-    if args.chaos_mode:
-        test_chaos_resistance(args.iterations)
+    # Run benchmarks against a shared pool of validator workers
+    cache_size = 1024 if args.cache else 0
+    asyncio.run(run_benchmarks(args, workers, cache_size))
     
     print(f"\n{'='*60}")
     print("BENCHMARK COMPLETE")
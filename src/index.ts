@@ -2198,9 +2198,13 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
 
 // Start the server or handle CLI commands
 async function main() {
-  bridgeServer.start();
-
   const args = process.argv.slice(2);
+
+  // wave-validate is a one-shot CLI or a batch worker (often several at once);
+  // it has no use for the telemetry bridge and must not claim its port
+  if (args[0] !== 'wave-validate' && args[0] !== 'wave_validate') {
+    bridgeServer.start();
+  }
   
   // Check if this is a CLI command
   if (args.length > 0) {
@@ -2213,6 +2217,7 @@ async function main() {
       console.log('  npx coherence-mcp                     (Starts the MCP server on stdio)');
       console.log('  npx coherence-mcp setup               (Runs interactive configuration)');
       console.log('  npx coherence-mcp wave-validate <f>   (Validates coherence for a file)');
+      console.log('  npx coherence-mcp wave-validate --server  (JSON-lines validation worker on stdin/stdout)');
       console.log('  npx coherence-mcp anamnesis <cmd>     (Security validation tools)');
       console.log('  npx coherence-mcp fibonacci <cmd>     (Impact & weighting tools)');
       console.log('  npx coherence-mcp --help              (Shows this message)');
@@ -2264,6 +2269,11 @@ async function main() {
 async function handleWaveValidateCLI(args: string[]) {
   const fs = await import('fs/promises');
   
+  if (args.includes('--server')) {
+    await runWaveValidateServer();
+    return;
+  }
+  
   // Parse arguments
   let filePath: string | undefined;
   let content: string | undefined;
@@ -2332,6 +2342,73 @@ async function handleWaveValidateCLI(args: string[]) {
   }
 }
 
+// Long-lived wave-validate worker (coherence-mcp wave-validate --server).
+// Reads one JSON request per stdin line and writes one JSON reply per stdout
+// line, so callers pay Node startup once:
+//   {"path": "...", "threshold": 80}         -> {"score": 92, "passed": true, ...}
+//   {"content": "...", "threshold": 80}      -> same, without touching the filesystem
+//   {"batch": [{"path"|"content": ..., "threshold": ...}, ...]} -> {"results": [...]}
+async function runWaveValidateServer() {
+  const fs = await import('fs/promises');
+  const readline = await import('readline');
+  
+  // stdout carries nothing but JSON reply lines; stray logging goes to stderr
+  console.log = console.error;
+  console.info = console.error;
+  console.debug = console.error;
+  
+  const validateJob = async (job: any): Promise<Record<string, unknown>> => {
+    try {
+      const threshold = typeof job.threshold === 'number' ? job.threshold : 80;
+      // Inline content skips the filesystem entirely; path is read as before
+      const content = typeof job.content === 'string' ? job.content : await fs.readFile(job.path, 'utf-8');
+      const start = performance.now();
+      const score = await validateWAVE(content, threshold);
+      const elapsedMs = performance.now() - start;
+      return {
+        score: score.overall,
+        passed: score.overall >= threshold,
+        threshold,
+        semantic: score.semantic,
+        references: score.references,
+        structure: score.structure,
+        consistency: score.consistency,
+        violations: score.violations.length,
+        elapsed_ms: elapsedMs,
+      };
+    } catch (error) {
+      return { error: error instanceof Error ? error.message : String(error) };
+    }
+  };
+  
+  const rl = readline.createInterface({ input: process.stdin, terminal: false });
+  
+  // Requests (and batch items) are handled strictly in order; replies line up with requests.
+  for await (const line of rl) {
+    if (!line.trim()) continue;
+    
+    let reply: Record<string, unknown>;
+    try {
+      const request = JSON.parse(line);
+      if (Array.isArray(request.batch)) {
+        const results: Record<string, unknown>[] = [];
+        for (const job of request.batch) {
+          results.push(await validateJob(job));
+        }
+        reply = { results };
+      } else {
+        reply = await validateJob(request);
+      }
+    } catch (error) {
+      reply = { error: error instanceof Error ? error.message : String(error) };
+    }
+    process.stdout.write(JSON.stringify(reply) + '\n');
+  }
+  
+  // stdin closed: the caller is done with us
+  process.exit(0);
+}
+
 // Handle Anamnesis CLI commands
 async function handleAnamnesisCliCommands(args: string[]) {
   if (args.length === 0) {
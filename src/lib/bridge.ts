@@ -44,6 +44,13 @@ export class BridgeServer {
       this.wss = new WebSocketServer({ port: this.port });
       console.error(`[Bridge] WebSocket server started on ws://127.0.0.1:${this.port}`);
 
+      // Listen errors (e.g. EADDRINUSE when another coherence-mcp process owns the
+      // port) arrive asynchronously; without a handler they crash the process.
+      this.wss.on("error", (err) => {
+        console.error(`[Bridge] Failed to start server: ${err.message}`);
+        this.stop();
+      });
+
       this.wss.on("connection", (ws) => {
         this.clients.add(ws);
         console.error(`[Bridge] TUI client connected. Total clients: ${this.clients.size}`);
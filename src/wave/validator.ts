@@ -72,18 +72,19 @@ function extractWords(text: string, minLength: number = MIN_WORD_LENGTH): string
   return text.toLowerCase().match(/\b\w{4,}\b/g) || [];
 }
 
+// Fibonacci table shared across validations, extended on demand
+const FIBONACCI_TABLE: number[] = [1, 1];
+
 /**
  * Generate Fibonacci sequence up to n terms
  */
 function generateFibonacci(n: number): number[] {
   if (n <= 0) return [];
-  if (n === 1) return [1];
   
-  const fib = [1, 1];
-  for (let i = 2; i < n; i++) {
-    fib.push(fib[i - 1] + fib[i - 2]);
+  for (let i = FIBONACCI_TABLE.length; i < n; i++) {
+    FIBONACCI_TABLE.push(FIBONACCI_TABLE[i - 1] + FIBONACCI_TABLE[i - 2]);
   }
-  return fib;
+  return FIBONACCI_TABLE.slice(0, n);
 }
 
 /**
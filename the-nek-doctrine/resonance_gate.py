@@ -6,9 +6,15 @@ import os
 # A structural filter for the First Cohort.
 # If you cannot run this, you cannot hold the ridge.
 def typing_effect(text, speed=0.03):
+    # Piped/automated runs (or NEK_FAST=1) get the line at once, unpaced
+    if not sys.stdout.isatty() or os.environ.get("NEK_FAST"):
+        print(text)
+        return
+    write = sys.stdout.write
+    flush = sys.stdout.flush
     for char in text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
+        write(char)
+        flush()  # stdout is line-buffered on a tty; flush so each char shows
         time.sleep(speed)
     print()
 def clear_screen():
@@ -74,7 +80,8 @@ def main():
     # Create a unique hash based on time, handle, and the successful constraint
     timestamp = str(int(time.time()))
     raw_string = f"{handle}-{alpha}-{omega}-{timestamp}-THE-NEK"
-    resonance_hash = hashlib.sha256(raw_string.encode()).hexdigest()[:16].upper()
+    # 8-byte digest == the 16 hex chars we display; nothing computed to be discarded
+    resonance_hash = hashlib.blake2b(raw_string.encode(), digest_size=8).hexdigest().upper()
     
     print("\033[92m" + "="*50)
     print(f"RESONANCE CODE: {resonance_hash}")
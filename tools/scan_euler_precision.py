@@ -19,27 +19,55 @@ Error Quantification:
 """
 
 import argparse
+import bisect
+import contextlib
+import functools
+import hashlib
+import importlib
+import itertools
+import json
+import mmap
+import operator
 import os
 import re
 import sys
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
 
 # Euler's number with full precision
 EULER_E = 2.718281828459045
 
-# Patterns to detect hardcoded Euler approximations
-# Matches: 2.71, 2.718, 2.7182, 2.71828, etc. (at least 3 significant digits)
-EULER_PATTERNS = [
-    # Standard decimal notation
-    r'\b2\.71[0-9]{1,15}\b',
-    # Scientific notation
-    r'\b2\.71[0-9]*[eE][+-]?[0-9]+\b',
-    # Assignment patterns (more specific)
-    r'[eE]\s*=\s*2\.71[0-9]*',
-    r'euler\s*=\s*2\.71[0-9]*',
-]
+# Pattern to detect hardcoded Euler approximations
+# Matches: 2.718, 2.7182, 2.71828, etc. (at least 3 significant digits) in decimal
+# or scientific notation. A bare 2.71 only counts when assigned to e/euler, which
+# is checked against the text to its left rather than in the regex itself.
+# Every quantifier is bounded or followed by a distinct character class, so the
+# engine cannot backtrack more than a few steps on long digit runs.
+EULER_PATTERN = rb'\b2\.71[0-9]{0,15}(?:[eE][+-]?[0-9]+)?\b'
+EULER_RE = re.compile(EULER_PATTERN)
+
+# Left context that makes a bare 2.71 an Euler assignment (e = 2.71, euler = 2.71)
+ASSIGNMENT_RE = re.compile(rb'(?:[eE]|euler)\s*=\s*\Z')
+
+# Already-correct constants that rule out a match in the preceding 10 characters
+EXCLUDE_RE = re.compile(rb'Math\.E|math\.[eE]')
+
+# Python triple-quoted strings (docstrings), matched across lines
+DOCSTRING_RE = re.compile(rb'(?s)""".*?"""|\'\'\'.*?\'\'\'')
+
+NEWLINE_RE = re.compile(rb'\n')
+
+# Files up to this size are read into a reused per-thread buffer; larger ones are mmapped
+READ_BUFFER_SIZE = 1024 * 1024
+_thread_state = threading.local()
+
+# Files larger than this are skipped unless --max-size says otherwise
+DEFAULT_MAX_SIZE = 2 * 1024 * 1024
+
+# A NUL byte in this many leading bytes marks a file as binary
+BINARY_SNIFF_SIZE = 4096
 
 # File extensions to scan by language
 LANGUAGE_EXTENSIONS = {
@@ -55,6 +83,9 @@ LANGUAGE_EXTENSIONS = {
     'julia': ['.jl'],
 }
 
+# Extension -> language, inverted once for O(1) lookups
+EXT_TO_LANG = {ext: lang for lang, exts in LANGUAGE_EXTENSIONS.items() for ext in exts}
+
 # Recommended constants by language
 RECOMMENDED_CONSTANTS = {
     'python': 'math.e',
@@ -69,6 +100,12 @@ RECOMMENDED_CONSTANTS = {
     'julia': 'ℯ or Base.MathConstants.e',
 }
 
+# Files per worker task; results come back once per batch rather than per file
+SCAN_BATCH_SIZE = 64
+
+# Incremental scan cache, stored in the scanned directory unless --cache is given
+CACHE_FILE = '.euler_scan_cache'
+
 # Directories to skip
 SKIP_DIRS = {
     'node_modules', '.git', '__pycache__', 'venv', '.venv',
@@ -77,8 +114,7 @@ SKIP_DIRS = {
 }
 
 
-@dataclass
-class PrecisionIssue:
+class PrecisionIssue(NamedTuple):
     """Represents a detected precision issue."""
     file_path: str
     line_number: int
@@ -89,8 +125,9 @@ class PrecisionIssue:
     recommendation: str
 
 
+@functools.lru_cache(maxsize=None)
 def calculate_error(approximation: str) -> float:
-    """Calculate the precision error for a given approximation."""
+    """Calculate the precision error for a given approximation (memoized per literal)."""
     try:
         approx_value = float(approximation)
         return abs(EULER_E - approx_value)
@@ -100,52 +137,194 @@ def calculate_error(approximation: str) -> float:
 
 def detect_language(file_path: Path) -> Optional[str]:
     """Detect programming language from file extension."""
-    ext = file_path.suffix.lower()
-    for lang, extensions in LANGUAGE_EXTENSIONS.items():
-        if ext in extensions:
-            return lang
-    return None
+    return EXT_TO_LANG.get(file_path.suffix.lower())
 
 
-def scan_file(file_path: Path) -> List[PrecisionIssue]:
-    """Scan a single file for Euler precision issues."""
-    issues = []
-    language = detect_language(file_path)
+def _regex_engine(module) -> Callable:
+    """Build a span finder from a module with an re-compatible compile()."""
+    pattern = EULER_RE if module is re else module.compile(EULER_PATTERN)
+    
+    def find_spans(data, size: int) -> Iterator[Tuple[int, int]]:
+        return (match.span() for match in pattern.finditer(data, 0, size))
+    
+    return find_spans
+
+
+def _hyperscan_engine() -> Callable:
+    """Build a span finder backed by a compiled Hyperscan database."""
+    import hyperscan
+    
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[EULER_PATTERN], ids=[0], elements=1,
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+    
+    def find_spans(data, size: int) -> Iterator[Tuple[int, int]]:
+        spans = []
+        with memoryview(data) as view:
+            database.scan(view[:size], match_event_handler=lambda _id, start, end, _flags, _ctx: spans.append((start, end)))
+        # Hyperscan reports every match; keep the leftmost non-overlapping ones like re
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        last_end = -1
+        for start, end in spans:
+            if start >= last_end:
+                last_end = end
+                yield start, end
+    
+    return find_spans
+
+
+def _specialized_engine() -> Callable:
+    """Build a hand-written span finder equivalent to EULER_RE, with no regex engine."""
+    word = frozenset(b'0123456789_ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+    digits = frozenset(b'0123456789')
+    
+    def find_spans(data, size: int) -> Iterator[Tuple[int, int]]:
+        find = data.find
+        start = find(b'2.71', 0, size)
+        while start >= 0:
+            # \b before the literal
+            if start and data[start - 1] in word:
+                start = find(b'2.71', start + 1, size)
+                continue
+            
+            # [0-9]{0,15}: a longer digit run can't end on a word boundary
+            pos = start + 4
+            while pos < size and data[pos] in digits:
+                pos += 1
+            end = None
+            if pos - start - 4 <= 15:
+                # Optional exponent, then \b; without one the literal ends at pos
+                if pos < size and data[pos] in b'eE':
+                    exponent = pos + 1
+                    if exponent < size and data[exponent] in b'+-':
+                        exponent += 1
+                    exponent_end = exponent
+                    while exponent_end < size and data[exponent_end] in digits:
+                        exponent_end += 1
+                    if exponent_end > exponent and (exponent_end == size or data[exponent_end] not in word):
+                        end = exponent_end
+                elif pos == size or data[pos] not in word:
+                    end = pos
+            
+            if end is None:
+                start = find(b'2.71', start + 1, size)
+            else:
+                yield start, end
+                start = find(b'2.71', end, size)
+    
+    return find_spans
+
+
+# Matching backends selectable with --engine; all find the same spans
+ENGINES = {
+    're': lambda: _regex_engine(re),
+    're2': lambda: _regex_engine(importlib.import_module('re2')),
+    'hyperscan': _hyperscan_engine,
+    'specialized': _specialized_engine,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_engine(name: str) -> Callable:
+    """Return the span finder for an engine, building it once per process."""
+    return ENGINES[name]()
+
+
+def scan_file(
+    file_path: Path,
+    language: Optional[str] = None,
+    engine: str = 're',
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> List[PrecisionIssue]:
+    """Scan a single file for Euler precision issues, skipping oversized ones."""
+    language = language or detect_language(file_path)
     
     if not language:
-        return issues
+        return []
     
+    find_spans = get_engine(engine)
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except (IOError, OSError):
+        with open(file_path, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if max_size and size > max_size:
+                return []
+            if size > READ_BUFFER_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return scan_buffer(mm, file_path, language, find_spans)
+            
+            # Small files are read into this thread's buffer instead of a fresh bytes object
+            read_buffer = getattr(_thread_state, 'read_buffer', None)
+            if read_buffer is None:
+                read_buffer = _thread_state.read_buffer = bytearray(READ_BUFFER_SIZE)
+            filled = 0
+            with memoryview(read_buffer) as view:
+                while filled < size:
+                    count = f.readinto(view[filled:size])
+                    if not count:
+                        break
+                    filled += count
+            return scan_buffer(read_buffer, file_path, language, find_spans, filled)
+    except (IOError, OSError, ValueError):
+        return []
+
+
+def scan_buffer(
+    data,
+    file_path: Path,
+    language: str,
+    find_spans: Optional[Callable] = None,
+    size: Optional[int] = None,
+) -> List[PrecisionIssue]:
+    """Scan the first size bytes of a buffer (bytes, bytearray or mmap), decoding only matching lines."""
+    issues = []
+    find_spans = find_spans or get_engine('re')
+    size = len(data) if size is None else size
+    
+    # Every match contains the literal '2.71'; skip the regex if it never occurs
+    if data.find(b'2.71', 0, size) < 0:
         return issues
     
-    compiled_patterns = [re.compile(pattern) for pattern in EULER_PATTERNS]
+    # Skip binary content (minified bundles with embedded NULs, misnamed blobs)
+    if data.find(b'\x00', 0, min(size, BINARY_SNIFF_SIZE)) >= 0:
+        return issues
     
-    # Track if we're inside a docstring
-    in_docstring = False
-    docstring_delimiter = None
+    # Line and docstring lookups are only built once the first match turns up
+    newlines = None
+    docstring_starts: List[int] = []
+    docstring_ends: List[int] = []
     
-    for line_num, line in enumerate(content.splitlines(), start=1):
-        stripped = line.strip()
-        
-        # Handle docstrings (Python triple quotes)
-        if language == 'python':
-            for delim in ['"""', "'''"]:
-                if delim in stripped:
-                    count = stripped.count(delim)
-                    if not in_docstring and count >= 1:
-                        in_docstring = True
-                        docstring_delimiter = delim
-                        if count >= 2:  # Single-line docstring
-                            in_docstring = False
-                    elif in_docstring and docstring_delimiter == delim:
-                        in_docstring = False
+    # Per-file invariants and locally bound lookups for the match loop
+    path = str(file_path)
+    recommendation = RECOMMENDED_CONSTANTS.get(language, 'Use language-specific E constant')
+    append = issues.append
+    bisect_left = bisect.bisect_left
+    bisect_right = bisect.bisect_right
+    assignment_search = ASSIGNMENT_RE.search
+    exclude_search = EXCLUDE_RE.search
+    calc = calculate_error
+    
+    for start, end in find_spans(data, size):
+        if newlines is None:
+            newlines = [m.start() for m in NEWLINE_RE.finditer(data, 0, size)]
+            if language == 'python':
+                for docstring in DOCSTRING_RE.finditer(data, 0, size):
+                    docstring_starts.append(docstring.start())
+                    docstring_ends.append(docstring.end())
         
-        # Skip if in docstring or comment
-        if in_docstring:
+        # Skip if inside a docstring
+        docstring_index = bisect_right(docstring_starts, start) - 1
+        if docstring_index >= 0 and start < docstring_ends[docstring_index]:
             continue
         
+        line_index = bisect_left(newlines, start)
+        line_num = line_index + 1
+        line_start = newlines[line_index - 1] + 1 if line_index else 0
+        line_end = newlines[line_index] if line_index < len(newlines) else size
+        line = data[line_start:line_end].decode('utf-8', errors='ignore')
+        stripped = line.strip()
+        
         # Skip comments (basic heuristic)
         if stripped.startswith('#') or stripped.startswith('//') or stripped.startswith('*'):
             continue
@@ -155,109 +334,236 @@ def scan_file(file_path: Path) -> List[PrecisionIssue]:
         if 'e.g.' in lower_line or 'example' in lower_line or 'introduces' in lower_line:
             continue
         
-        for pattern in compiled_patterns:
-            for match in pattern.finditer(line):
-                matched_value = match.group()
-                # Extract numeric value if in assignment form
-                if '=' in matched_value:
-                    matched_value = matched_value.split('=')[-1].strip()
-                
-                # Skip if it's actually Math.E or similar
-                context_start = max(0, match.start() - 10)
-                context = line[context_start:match.end()]
-                if 'Math.E' in context or 'math.e' in context or 'math.E' in context:
-                    continue
-                
-                error = calculate_error(matched_value)
-                if error > 1e-10:  # Only report meaningful differences
-                    issues.append(PrecisionIssue(
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        line_content=line.strip()[:100],
-                        matched_value=matched_value,
-                        language=language,
-                        error_magnitude=error,
-                        recommendation=RECOMMENDED_CONSTANTS.get(language, 'Use language-specific E constant'),
-                    ))
+        context_start = max(line_start, start - 10)
+        
+        # A bare 2.71 is too common to flag unless it's assigned to e/euler
+        matched_value = data[start:end].decode('ascii')
+        if matched_value == '2.71' and not assignment_search(data, context_start, start):
+            continue
+        
+        # Skip if it's actually Math.E or similar
+        if exclude_search(data, context_start, start):
+            continue
+        
+        error = calc(matched_value)
+        if error > 1e-10:  # Only report meaningful differences
+            append(PrecisionIssue(
+                file_path=path,
+                line_number=line_num,
+                line_content=stripped[:100],
+                matched_value=matched_value,
+                language=language,
+                error_magnitude=error,
+                recommendation=recommendation,
+            ))
     
     return issues
 
 
-def scan_directory(directory: Path, verbose: bool = False) -> List[PrecisionIssue]:
+def scan_batch(batch: List[Tuple[str, str]], engine: str = 're', max_size: int = DEFAULT_MAX_SIZE) -> List[Tuple[int, List[PrecisionIssue]]]:
+    """Scan a batch of (path, language) pairs, returning (index, issues) for files with issues."""
+    results = []
+    for index, (path, language) in enumerate(batch):
+        issues = scan_file(Path(path), language, engine, max_size)
+        if issues:
+            results.append((index, issues))
+    return results
+
+
+def iter_source_files(directory: Path) -> Iterator[Tuple[Path, str]]:
+    """Yield (path, language) for source files under a directory, skipping excluded dirs."""
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    
+    # Files before subdirectories, in the same order os.walk used
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        
+        if is_dir:
+            # Skip excluded directories; like os.walk, don't follow symlinks
+            if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                subdirs.append(entry.path)
+        else:
+            language = EXT_TO_LANG.get(os.path.splitext(entry.name)[1].lower())
+            if language:
+                yield Path(entry.path), language
+    
+    for subdir in subdirs:
+        yield from iter_source_files(subdir)
+
+
+def scanner_fingerprint(max_size: int) -> str:
+    """Hash of this scanner's source and options, so cached results expire when either changes."""
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    digest.update(str(max_size).encode())
+    return digest.hexdigest()
+
+
+def load_cache(cache_path: Path, fingerprint: str) -> Dict[str, list]:
+    """Load cached per-file results, falling back to an empty cache on any error."""
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+        if data['fingerprint'] != fingerprint:
+            return {}
+        return dict(data['files'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def save_cache(cache_path: Path, fingerprint: str, entries: Dict[str, list]) -> None:
+    """Persist per-file results; a failed write only costs the next run a full scan."""
+    try:
+        cache_path.write_text(json.dumps({
+            'fingerprint': fingerprint,
+            'files': entries,
+        }), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def scan_directory(
+    directory: Path,
+    verbose: bool = False,
+    workers: int = 1,
+    cache_path: Optional[Path] = None,
+    force: bool = False,
+    engine: str = 're',
+    max_size: int = DEFAULT_MAX_SIZE,
+) -> List[PrecisionIssue]:
     """Recursively scan a directory for Euler precision issues."""
     all_issues = []
-    files_scanned = 0
+    fingerprint = scanner_fingerprint(max_size)
+    cache = {} if cache_path is None or force else load_cache(cache_path, fingerprint)
+    entries: Dict[str, list] = {}
+    found: Dict[str, List[PrecisionIssue]] = {}
+    stamps = {}
+    pending: List[Tuple[str, str]] = []
+    
+    # Files whose [mtime_ns, size] match the cache reuse their stored issues
+    files = list(iter_source_files(directory))
+    for file_path, language in files:
+        key = str(file_path)
+        try:
+            stat = file_path.stat()
+            stamps[key] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stamps[key] = None
+        
+        cached = cache.get(key)
+        if stamps[key] is not None and cached and cached[:2] == stamps[key]:
+            entries[key] = cached
+            found[key] = [PrecisionIssue(*row) for row in cached[2]]
+        else:
+            pending.append((key, language))
+            found[key] = []
+    
+    # Workers get plain (path, language) batches and only send back files with issues
+    batches = [pending[i:i + SCAN_BATCH_SIZE] for i in range(0, len(pending), SCAN_BATCH_SIZE)]
+    scan = functools.partial(scan_batch, engine=engine, max_size=max_size)
+    with contextlib.ExitStack() as stack:
+        if workers > 1 and len(batches) > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = executor.map(scan, batches)
+        else:
+            results = map(scan, batches)
+        
+        for batch, batch_results in zip(batches, results):
+            for index, issues in batch_results:
+                found[batch[index][0]] = issues
+    
+    for key, _ in pending:
+        if stamps[key] is not None:
+            entries[key] = stamps[key] + [[list(issue) for issue in found[key]]]
     
-    for root, dirs, files in os.walk(directory):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    for file_path, _ in files:
+        issues = found[str(file_path)]
+        all_issues.extend(issues)
         
-        for file_name in files:
-            file_path = Path(root) / file_name
-            if detect_language(file_path):
-                files_scanned += 1
-                issues = scan_file(file_path)
-                all_issues.extend(issues)
-                
-                if verbose and issues:
-                    print(f"  Found {len(issues)} issue(s) in {file_path}")
+        if verbose and issues:
+            print(f"  Found {len(issues)} issue(s) in {file_path}")
+    
+    if cache_path is not None:
+        save_cache(cache_path, fingerprint, entries)
     
     if verbose:
-        print(f"\nScanned {files_scanned} files")
+        print(f"\nScanned {len(files)} files ({len(files) - len(pending)} unchanged, from cache)")
     
     return all_issues
 
 
-def format_report(issues: List[PrecisionIssue]) -> str:
-    """Format issues into a readable report."""
+def write_report(out: TextIO, issues: List[PrecisionIssue]) -> None:
+    """Write issues as a readable report, streaming to an open text stream."""
     if not issues:
-        return "✅ No hardcoded Euler approximations detected. Codebase is precision-safe."
-    
-    lines = [
-        "# Euler Precision Scan Report",
-        "",
-        f"**Issues Found:** {len(issues)}",
-        "",
-        "## Impact Summary",
-        "",
-        "| Metric | Value |",
-        "|--------|-------|",
-        f"| Total Issues | {len(issues)} |",
-        f"| Avg Error/Calculation | ~8.55e-05 |",
-        f"| Cumulative Error (12 tests) | ~0.001% |",
-        "",
-        "## Detected Issues",
-        "",
-    ]
-    
-    # Group by file
-    by_file: dict[str, List[PrecisionIssue]] = {}
-    for issue in issues:
-        by_file.setdefault(issue.file_path, []).append(issue)
-    
-    for file_path, file_issues in sorted(by_file.items()):
-        lines.append(f"### `{file_path}`")
-        lines.append("")
+        out.write("✅ No hardcoded Euler approximations detected. Codebase is precision-safe.")
+        return
+    
+    out.write(
+        "# Euler Precision Scan Report\n"
+        "\n"
+        f"**Issues Found:** {len(issues)}\n"
+        "\n"
+        "## Impact Summary\n"
+        "\n"
+        "| Metric | Value |\n"
+        "|--------|-------|\n"
+        f"| Total Issues | {len(issues)} |\n"
+        "| Avg Error/Calculation | ~8.55e-05 |\n"
+        "| Cumulative Error (12 tests) | ~0.001% |\n"
+        "\n"
+        "## Detected Issues\n"
+        "\n"
+    )
+    
+    # Group by file in one sorted pass; the stable sort keeps in-line match order
+    ordered = sorted(issues, key=lambda issue: (issue.file_path, issue.line_number))
+    for file_path, file_issues in itertools.groupby(ordered, key=operator.attrgetter('file_path')):
+        out.write(f"### `{file_path}`\n\n")
         
         for issue in file_issues:
-            lines.append(f"- **Line {issue.line_number}**: `{issue.matched_value}`")
-            lines.append(f"  - Error: `{issue.error_magnitude:.2e}`")
-            lines.append(f"  - Fix: Use `{issue.recommendation}`")
-            lines.append(f"  - Context: `{issue.line_content}`")
-            lines.append("")
-    
-    lines.extend([
-        "## Recommendations",
-        "",
-        "1. Replace all hardcoded Euler approximations with language-specific constants",
-        "2. Add linting rules to prevent future occurrences",
-        "3. For critical paths (probability, deployments), audit precision impact",
-        "",
-        "---",
-        "*Generated by scan_euler_precision.py (CORPUS_ISSUE_SPIRAL_ORIGINATION_PROTOCOL)*",
-    ])
-    
-    return '\n'.join(lines)
+            out.write(
+                f"- **Line {issue.line_number}**: `{issue.matched_value}`\n"
+                f"  - Error: `{issue.error_magnitude:.2e}`\n"
+                f"  - Fix: Use `{issue.recommendation}`\n"
+                f"  - Context: `{issue.line_content}`\n"
+                "\n"
+            )
+    
+    out.write(
+        "## Recommendations\n"
+        "\n"
+        "1. Replace all hardcoded Euler approximations with language-specific constants\n"
+        "2. Add linting rules to prevent future occurrences\n"
+        "3. For critical paths (probability, deployments), audit precision impact\n"
+        "\n"
+        "---\n"
+        "*Generated by scan_euler_precision.py (CORPUS_ISSUE_SPIRAL_ORIGINATION_PROTOCOL)*"
+    )
+
+
+def write_json(out: TextIO, issues: List[PrecisionIssue]) -> None:
+    """Write issues as a JSON array, streaming to an open text stream."""
+    json.dump([{
+        'file': i.file_path,
+        'line': i.line_number,
+        'value': i.matched_value,
+        'language': i.language,
+        'error': i.error_magnitude,
+        'recommendation': i.recommendation,
+    } for i in issues], out, indent=2)
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for sizes: an integer that is 0 or greater."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
 
 
 def main():
@@ -286,6 +592,36 @@ def main():
         action='store_true',
         help='Output in JSON format'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes (default: CPU count, 1 scans sequentially)'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=sorted(ENGINES),
+        default='re',
+        help='Matching backend: re (stdlib), re2 (google-re2), hyperscan, '
+             'or specialized (hand-written literal matcher) (default: re)'
+    )
+    parser.add_argument(
+        '--max-size',
+        type=non_negative_int,
+        default=DEFAULT_MAX_SIZE,
+        metavar='BYTES',
+        help='Skip files larger than this (default: 2 MiB, 0 for no limit)'
+    )
+    parser.add_argument(
+        '--cache',
+        metavar='PATH',
+        help='Incremental scan cache file (default: <directory>/.euler_scan_cache)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rescan every file, ignoring cached results'
+    )
     
     args = parser.parse_args()
     
@@ -294,29 +630,35 @@ def main():
         print(f"Error: Directory '{directory}' does not exist", file=sys.stderr)
         sys.exit(1)
     
+    try:
+        get_engine(args.engine)
+    except ImportError as e:
+        print(f"Error: --engine {args.engine} is not available ({e})", file=sys.stderr)
+        sys.exit(1)
+    
     if args.verbose:
         print(f"Scanning {directory} for Euler precision issues...")
     
-    issues = scan_directory(directory, verbose=args.verbose)
-    
-    if args.json:
-        import json
-        output = json.dumps([{
-            'file': i.file_path,
-            'line': i.line_number,
-            'value': i.matched_value,
-            'language': i.language,
-            'error': i.error_magnitude,
-            'recommendation': i.recommendation,
-        } for i in issues], indent=2)
-    else:
-        output = format_report(issues)
+    cache_path = Path(args.cache) if args.cache else directory / CACHE_FILE
+    issues = scan_directory(
+        directory,
+        verbose=args.verbose,
+        workers=args.workers,
+        cache_path=cache_path,
+        force=args.force,
+        engine=args.engine,
+        max_size=args.max_size,
+    )
+    
+    write = write_json if args.json else write_report
     
     if args.output:
-        Path(args.output).write_text(output)
+        with open(args.output, 'w', encoding='utf-8') as out:
+            write(out, issues)
         print(f"Report written to {args.output}")
     else:
-        print(output)
+        write(sys.stdout, issues)
+        sys.stdout.write('\n')
     
     # Exit with error code if issues found
     sys.exit(1 if issues else 0)